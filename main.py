@@ -13,7 +13,6 @@ from .src.storage import PluginStateStore
 from .src.storage.keys import (
     CONFIG_API_KEY_KEY,
     CONFIG_BASE_URL_KEY,
-    CONFIG_IMAGE_MODELS_KEY,
     CONFIG_PROVIDER_KEY,
     CONFIG_SAVE_IMAGE_FORMAT_KEY,
     CONFIG_SHOW_IMAGE_GENERATE_DETAILS_KEY,
@@ -24,8 +23,15 @@ from .src.storage.keys import (
 from .src.tools.draw_args import parse_draw_args
 from .src.tools.image import extract_images_from_event
 from .src.utils.args import extract_command_args
+from .src.utils.http import close_shared_session
 from .src.utils.log import logger
 
+DRAW_START_MESSAGE_TEMPLATE = (
+    "生图任务开始\n"
+    "ratio={ratio}  size={size}  参考图={reference_count} 张\n"
+    "prompt={prompt}"
+)
+
 
 class MyPlugin(Star):
     def __init__(self, context: Context, config: AstrBotConfig):
@@ -97,8 +103,7 @@ class MyPlugin(Star):
     async def prl_models(self, event: AstrMessageEvent):
         """列出当前生图模型和全部可用生图模型。"""
         current_model = await self.state_store.get_value(CURRENT_IMAGE_MODEL_KEY, "")
-        image_models = self.state_store.get_config_value(CONFIG_IMAGE_MODELS_KEY, [])
-        assert isinstance(image_models, list)
+        image_models = self.state_store.get_image_models()
 
         lines = [
             "生图模型管理",
@@ -108,8 +113,10 @@ class MyPlugin(Star):
         if not image_models:
             lines.append("- （空）")
         else:
-            for index, model_name in enumerate(image_models, start=1):
-                lines.append(f"{index}. {model_name}")
+            lines.extend(
+                f"{index}. {model_name}"
+                for index, model_name in enumerate(image_models, start=1)
+            )
 
         yield event.plain_result("\n".join(lines))
 
@@ -154,12 +161,11 @@ class MyPlugin(Star):
 
         reference_images = await extract_images_from_event(event)
         yield event.plain_result(
-            "\n".join(
-                [
-                    "生图任务开始",
-                    f"ratio={ratio or '(默认)'}  size={size or '(默认)'}  参考图={len(reference_images)} 张",
-                    f"prompt={prompt}",
-                ]
+            DRAW_START_MESSAGE_TEMPLATE.format(
+                ratio=ratio or "(默认)",
+                size=size or "(默认)",
+                reference_count=len(reference_images),
+                prompt=prompt,
             )
         )
 
@@ -193,3 +199,5 @@ class MyPlugin(Star):
         self.context.provider_manager.llm_tools.remove_func(
             self.provider_adapter.image_generate_tool_name
         )
+        # 释放 HTTP 共享会话持有的连接池。
+        await close_shared_session()
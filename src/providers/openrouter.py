@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from astrbot.api import FunctionTool
 from astrbot.api.event import AstrMessageEvent
 
 from ..resources import ResourceSpec
-from ..utils.dicts import get_dict_value
 from ..utils.errors import PluginErrorCode, PluginException
 from ..utils.http import PostJsonSuccessResponse, post_json
 from ..utils.log import logger
@@ -90,16 +91,22 @@ class OpenRouterAdapter(ProviderAdapter):
     tool_model: str
     save_image_format: str = "jpg"
     provider: str = "openrouter"
+    _chat_completions_url: str = field(init=False, repr=False, default="")
+    _has_api_key: bool = field(init=False, repr=False, default=False)
 
     def __post_init__(self) -> None:
         normalized = self.base_url.strip()
         self.base_url = normalized or OPENROUTER_DEFAULT_BASE_URL
+        # base_url 构造后不再变化，请求地址只拼接一次。
+        self._chat_completions_url = f"{self.base_url.rstrip('/')}/chat/completions"
+        # api_key 同样只在构造时确定；未配置时仍允许构造，请求时再报错。
+        self._has_api_key = bool(self.api_key.strip())
 
     async def _request_chat_completions(
         self, payload: dict[str, Any]
     ) -> PostJsonSuccessResponse:
         """统一请求 OpenRouter chat/completions 并返回响应封装对象。"""
-        if not self.api_key.strip():
+        if not self._has_api_key:
             raise PluginException(
                 code=PluginErrorCode.PERMISSION_DENIED,
                 message="OpenRouter API key is not configured.",
@@ -109,9 +116,8 @@ class OpenRouterAdapter(ProviderAdapter):
                     "base_url": self.base_url,
                 },
             )
-        url = f"{self.base_url.rstrip('/')}/chat/completions"
         response = await post_json(
-            url=url,
+            url=self._chat_completions_url,
             payload=payload,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
@@ -148,14 +154,14 @@ class OpenRouterAdapter(ProviderAdapter):
                 }
             )
 
-        image_config = {
-            key: value
-            for key, value in {
-                "aspect_ratio": payload.aspect_ratio.strip(),
-                "image_size": payload.image_size.strip(),
-            }.items()
-            if value
-        }
+        # 常见情况两者均未指定，直接跳过，不再构造临时字典。
+        image_config: dict[str, str] = {}
+        aspect_ratio = payload.aspect_ratio.strip()
+        if aspect_ratio:
+            image_config["aspect_ratio"] = aspect_ratio
+        image_size = payload.image_size.strip()
+        if image_size:
+            image_config["image_size"] = image_size
 
         request_payload: dict[str, Any] = {
             "model": image_model,
@@ -222,26 +228,33 @@ class OpenRouterAdapter(ProviderAdapter):
         if self.save_image_format != "jpg":
             return images
 
+        # 各图片的下载与转码互不依赖，并发执行；结果与告警仍按原顺序汇总。
+        results = await asyncio.gather(
+            *(self._convert_output_image_to_jpg(image) for image in images),
+            return_exceptions=True,
+        )
         converted_images: list[ResourceSpec] = []
-        for index, image in enumerate(images):
-            try:
-                image_blob = await image.convert_to_image_blob(
-                    timeout_sec=self.timeout_sec
-                )
-                jpg_blob = image_blob.compress_to_jpg()
-                converted_images.append(
-                    ResourceSpec.from_base64(
-                        jpg_blob.to_base64(),
-                        mime="image/jpeg",
-                    )
-                )
-            except Exception as exc:
+        for index, (image, result) in enumerate(zip(images, results)):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                # 取消等非常规异常不做回退，保持原有的向上传播行为。
+                raise result
+            if isinstance(result, Exception):
                 warnings.append(
-                    f"image[{index}] convert to jpg failed, fallback to original ({exc!s})."
+                    f"image[{index}] convert to jpg failed, fallback to original ({result!s})."
                 )
                 converted_images.append(image)
+                continue
+            converted_images.append(result)
         return converted_images
 
+    async def _convert_output_image_to_jpg(self, image: ResourceSpec) -> ResourceSpec:
+        image_blob = await image.convert_to_image_blob(timeout_sec=self.timeout_sec)
+        jpg_blob = await image_blob.compress_to_jpg_async()
+        return ResourceSpec.from_base64(
+            jpg_blob.to_base64(),
+            mime="image/jpeg",
+        )
+
     def get_image_generate_tool(
         self,
         *,
@@ -298,11 +311,18 @@ class OpenRouterAdapter(ProviderAdapter):
         )
 
 
-def _build_image_modalities_for_model(image_model: str) -> list[str]:
+@lru_cache(maxsize=32)
+def _resolve_image_modalities_for_model(image_model: str) -> tuple[str, ...]:
+    """按模型名判定输出模态；模型名取值有限，结果按模型缓存。"""
     model_name = image_model.strip().lower()
     if any(keyword in model_name for keyword in IMAGE_ONLY_MODALITY_MODEL_KEYWORDS):
-        return ["image"]
-    return ["image", "text"]
+        return ("image",)
+    return ("image", "text")
+
+
+def _build_image_modalities_for_model(image_model: str) -> list[str]:
+    # 每次返回新列表，避免请求体之间共享可变对象。
+    return list(_resolve_image_modalities_for_model(image_model))
 
 
 def _extract_openrouter_images(
@@ -316,20 +336,33 @@ def _extract_openrouter_images(
 
     for choice in choices:
         # 结构1：choices[].message.images[].image_url.url
-        message_images = get_dict_value(choice, "message", "images")
-        if isinstance(message_images, list):
-            for item in message_images:
-                raw_url = get_dict_value(item, "image_url", "url")
-                if isinstance(raw_url, str):
-                    normalized = raw_url.strip()
-                    if not normalized:
-                        continue
-                    try:
-                        if normalized.startswith(("http://", "https://")):
-                            output.append(ResourceSpec.from_http_url(normalized))
-                        elif normalized.startswith("data:"):
-                            output.append(ResourceSpec.from_data_url(normalized))
-                    except ValueError:
-                        continue
+        # 响应结构固定，逐层 isinstance 判断后直接取值，省去通用路径遍历的开销。
+        if not isinstance(choice, dict):
+            continue
+        message = choice.get("message")
+        if not isinstance(message, dict):
+            continue
+        message_images = message.get("images")
+        if not isinstance(message_images, list):
+            continue
+        for item in message_images:
+            if not isinstance(item, dict):
+                continue
+            image_url = item.get("image_url")
+            if not isinstance(image_url, dict):
+                continue
+            raw_url = image_url.get("url")
+            if not isinstance(raw_url, str):
+                continue
+            normalized = raw_url.strip()
+            if not normalized:
+                continue
+            try:
+                if normalized.startswith(("http://", "https://")):
+                    output.append(ResourceSpec.from_http_url(normalized))
+                elif normalized.startswith("data:"):
+                    output.append(ResourceSpec.from_data_url(normalized))
+            except ValueError:
+                continue
 
     return output
@@ -22,10 +22,7 @@ def parse_reference_images(raw_value: list[str] | None) -> list[ResourceSpec]:
         if normalized.startswith("data:"):
             parsed.append(ResourceSpec.from_data_url(normalized))
             continue
-        if normalized.startswith("base64://"):
-            parsed.append(ResourceSpec.from_base64(normalized, mime="image/png"))
-            continue
-        # 兼容直接传原始 base64 字符串。
+        # base64:// 前缀与原始 base64 字符串同样处理，前缀由 ResourceSpec 规范化时去除。
         parsed.append(ResourceSpec.from_base64(normalized, mime="image/png"))
     return parsed
 
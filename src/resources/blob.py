@@ -1,15 +1,43 @@
 from __future__ import annotations
 
+import asyncio
 from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO
 
-from .codec import encode_base64_payload, transfer_base64_to_data_url
+from PIL import Image
+
+from .codec import (
+    build_normalized_base64_data_url,
+    encode_base64_payload,
+    transfer_bytes_to_data_url,
+)
 from .mime import sniff_file_type
 
 
+class _CountingWriter:
+    """转发写入并统计字节数，不依赖 tell()，管道、套接字等不可 seek 的 sink 也可用"""
+
+    __slots__ = ("_sink", "written")
+
+    def __init__(self, sink: BinaryIO) -> None:
+        self._sink = sink
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+        self._sink.write(data)
+        self.written += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self._sink.flush()
+
+
 class ResourceBlob:
+    __slots__ = ("_base64", "data", "extension", "mime")
+
     data: bytes
-    """文件字节数据"""
+    """文件字节数据，构造后视为不可变（to_base64 结果按此缓存）"""
     mime: str
     """文件内容类型标识，嗅探结果兜底"""
     extension: str
@@ -23,6 +51,7 @@ class ResourceBlob:
         default_extension: str = "bin",
     ) -> None:
         self.data = data
+        self._base64: str | None = None
         normalized_default_extension = (
             default_extension.strip().lower().removeprefix(".")
         )
@@ -36,10 +65,15 @@ class ResourceBlob:
         self.extension = sniffed_extension
 
     def to_base64(self) -> str:
-        return encode_base64_payload(self.data)
+        if self._base64 is None:
+            self._base64 = encode_base64_payload(self.data)
+        return self._base64
 
     def to_data_url(self) -> str:
-        return transfer_base64_to_data_url(self.mime, self.to_base64())
+        if self._base64 is None:
+            return transfer_bytes_to_data_url(self.mime, self.data)
+        # mime 来自嗅探结果、缓存来自编码输出，两者均已规范化。
+        return build_normalized_base64_data_url(self.mime, self._base64)
 
     def save(self, path: str | Path) -> Path:
         output_path = Path(path)
@@ -56,6 +90,8 @@ class ResourceBlob:
 
 
 class ImageBlob(ResourceBlob):
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -71,29 +107,86 @@ class ImageBlob(ResourceBlob):
         if not self.mime.startswith("image/"):
             raise ValueError("image mime is not valid.")
 
-    def compress_to_jpg(self, quality: int = 85) -> ImageBlob:
+    def compress_to_jpg(
+        self,
+        quality: int = 85,
+        *,
+        optimize: bool = False,
+        max_side: int | None = None,
+    ) -> ImageBlob:
         """无副作用，将原对象压缩为JPG，返回新对象"""
+        output = BytesIO()
+        self.compress_to_jpg_stream(
+            output, quality=quality, optimize=optimize, max_side=max_side
+        )
+        return ImageBlob(
+            data=output.getvalue(),
+            default_mime="image/jpeg",
+            default_extension="jpg",
+        )
+
+    async def compress_to_jpg_async(
+        self,
+        quality: int = 85,
+        *,
+        optimize: bool = False,
+        max_side: int | None = None,
+    ) -> ImageBlob:
+        """compress_to_jpg 的异步版本，在线程中执行编解码，不阻塞事件循环"""
+        return await asyncio.to_thread(
+            self.compress_to_jpg,
+            quality,
+            optimize=optimize,
+            max_side=max_side,
+        )
+
+    def compress_to_jpg_stream(
+        self,
+        sink: BinaryIO,
+        quality: int = 85,
+        *,
+        optimize: bool = False,
+        max_side: int | None = None,
+    ) -> int:
+        """无副作用，将原对象压缩为JPG并直接写入 sink，返回写入的字节数
+
+        sink 只需支持 write，无需可 seek（可为管道、套接字等）。
+
+        optimize 开启后会额外执行一遍 Huffman 表优化，体积约小 5%，
+        但编码耗时接近翻倍，默认关闭。
+        max_side 指定时按比例缩小到长边不超过该值；JPEG 源会借助 draft
+        在解码阶段直接按 1/2、1/4、1/8 缩放，省去全尺寸解码。
+        """
 
         if quality < 1 or quality > 95:
             raise ValueError("quality must be in [1, 95].")
-
-        from PIL import Image
+        if max_side is not None and max_side <= 0:
+            raise ValueError("max_side must be > 0.")
 
         with Image.open(BytesIO(self.data)) as image:
+            if max_side is not None:
+                # 仅对 JPEG 等支持 draft 的格式生效，其余格式为空操作。
+                image.draft("RGB", (max_side, max_side))
             if image.mode in {"RGBA", "LA"} or (
                 image.mode == "P" and "transparency" in image.info
             ):
                 alpha = image.convert("RGBA")
-                background = Image.new("RGB", alpha.size, (255, 255, 255))
-                background.paste(alpha, mask=alpha.split()[-1])
-                rgb_image = background
+                if alpha.getextrema()[-1] == (255, 255):
+                    # alpha 通道完全不透明时无需与白底合成，直接丢弃 alpha。
+                    rgb_image = alpha.convert("RGB")
+                else:
+                    background = Image.new("RGB", alpha.size, (255, 255, 255))
+                    background.paste(alpha, mask=alpha.split()[-1])
+                    rgb_image = background
+            elif image.mode == "RGB":
+                # 已是 RGB（如 JPEG 源）时直接编码，省去一次全尺寸像素拷贝。
+                rgb_image = image
             else:
                 rgb_image = image.convert("RGB")
 
-            output = BytesIO()
-            rgb_image.save(output, format="JPEG", quality=quality, optimize=True)
-            return ImageBlob(
-                data=output.getvalue(),
-                default_mime="image/jpeg",
-                default_extension="jpg",
-            )
+            if max_side is not None and max(rgb_image.size) > max_side:
+                rgb_image.thumbnail((max_side, max_side), reducing_gap=2.0)
+
+            writer = _CountingWriter(sink)
+            rgb_image.save(writer, format="JPEG", quality=quality, optimize=optimize)
+            return writer.written
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import base64
 import binascii
 from typing import NamedTuple
 from urllib.parse import unquote_to_bytes
 
+import pybase64
+
 from .normalize import (
     normalize_base64_payload,
     normalize_mime,
@@ -15,14 +16,15 @@ def decode_base64_payload(value: str) -> bytes:
     """base64 => bytes 同时校验 value 是否有效"""
     normalized = normalize_base64_payload(value)
     try:
-        return base64.b64decode(normalized, validate=True)
+        # pybase64 基于 SIMD 实现，严格校验与解码在同一趟完成；长度不合法或多余填充均会被拒绝。
+        return pybase64.b64decode(normalized, validate=True)
     except (ValueError, binascii.Error) as exc:
         raise ValueError("base64 payload is invalid.") from exc
 
 
 def encode_base64_payload(data: bytes) -> str:
     """bytes => base64"""
-    return base64.b64encode(data).decode("ascii")
+    return pybase64.b64encode_as_string(data)
 
 
 class DataUrlHeader(NamedTuple):
@@ -39,11 +41,12 @@ def parse_data_url_header(data_url: str) -> DataUrlHeader:
 
     # 按第一个逗号切分：data:[meta],[payload]
     # meta: image/png; charset=utf-8; base64
-    header_and_data = normalized_data_url.removeprefix("data:")
-    try:
-        meta, payload = header_and_data.split(",", 1)
-    except ValueError as exc:
-        raise ValueError("data_url is invalid.") from exc
+    # 用下标直接切片，payload 只拷贝一次（removeprefix + split 会整段拷贝两次）。
+    comma_index = normalized_data_url.find(",", 5)
+    if comma_index == -1:
+        raise ValueError("data_url is invalid.")
+    meta = normalized_data_url[5:comma_index]
+    payload = normalized_data_url[comma_index + 1 :]
 
     # 将 meta 按分号拆分为片段，去除首尾空白并过滤空片段
     tokens = [segment.strip() for segment in meta.split(";") if segment.strip()]
@@ -72,9 +75,18 @@ def transfer_data_url_to_base64(data_url: str) -> str:
     header = parse_data_url_header(data_url)
     if header.is_base64:
         return normalize_base64_payload(header.payload)
-    # 非 base64 编码，需重新解码和编码
-    data, _ = transfer_data_url_to_bytes(data_url)
-    return encode_base64_payload(data)
+    # 非 base64 编码，复用已解析的头部，将百分号编码内容解码后重新编码
+    return encode_base64_payload(unquote_to_bytes(header.payload))
+
+
+def build_normalized_base64_data_url(mime: str, base64_payload: str) -> str:
+    """直接拼接 data URL，不做任何规范化。
+
+    调用方需保证 mime 非空且已规范化、base64_payload 已是规范 base64
+    （如 encode_base64_payload 的输出或 ResourceSpec 中已规范化的 raw），
+    以省去对整段 payload 的再次扫描与拷贝。
+    """
+    return f"data:{mime};base64,{base64_payload}"
 
 
 def transfer_base64_to_data_url(mime: str, base64_payload: str) -> str:
@@ -82,4 +94,13 @@ def transfer_base64_to_data_url(mime: str, base64_payload: str) -> str:
     if not normalized_mime:
         raise ValueError("mime is required to build data URL.")
     normalized_base64 = normalize_base64_payload(base64_payload)
-    return f"data:{normalized_mime};base64,{normalized_base64}"
+    return build_normalized_base64_data_url(normalized_mime, normalized_base64)
+
+
+def transfer_bytes_to_data_url(mime: str, data: bytes) -> str:
+    normalized_mime = normalize_mime(mime)
+    if not normalized_mime:
+        raise ValueError("mime is required to build data URL.")
+    return build_normalized_base64_data_url(
+        normalized_mime, encode_base64_payload(data)
+    )
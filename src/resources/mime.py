@@ -1,36 +1,133 @@
 from __future__ import annotations
 
 import mimetypes
-from urllib.parse import urlparse
+from functools import lru_cache
 
 import filetype
 
 from .codec import parse_data_url_header
 from .normalize import normalize_mime
 
+# filetype 仅读取前 8192 字节判定类型，嗅探时以此为窗口。
+_FILETYPE_SIGNATURE_BYTES = 8192
+
+# 提取 data URL 的 MIME 时仅扫描的头部长度。
+_DATA_URL_HEADER_SCAN_CHARS = 256
+
+# 常见图片格式的魔数表：(前缀, MIME, 扩展名)。
+# MIME/扩展名与 filetype 的判定结果保持一致，命中时无需再遍历 filetype 的全部匹配器。
+_IMAGE_SIGNATURES: tuple[tuple[bytes, str, str], ...] = (
+    (b"\xff\xd8\xff", "image/jpeg", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png", "png"),
+    (b"GIF", "image/gif", "gif"),
+    (b"RIFF", "image/webp", "webp"),
+    (b"BM", "image/bmp", "bmp"),
+    (b"II*\x00", "image/tiff", "tif"),
+    (b"MM\x00*", "image/tiff", "tif"),
+)
+
+# 按签名首字节分桶，嗅探时一次字典查找即可定位候选签名。
+_IMAGE_SIGNATURES_BY_FIRST_BYTE: dict[int, tuple[tuple[bytes, str, str], ...]] = {}
+for _entry in _IMAGE_SIGNATURES:
+    _IMAGE_SIGNATURES_BY_FIRST_BYTE[_entry[0][0]] = (
+        *_IMAGE_SIGNATURES_BY_FIRST_BYTE.get(_entry[0][0], ()),
+        _entry,
+    )
+del _entry
+
+
+def _extract_url_suffix(url: str) -> str:
+    """取 URL 路径最后一段的后缀部分（如 .png、.tar.gz），无后缀时返回空字符串。"""
+    end = len(url)
+    for separator in "?#":
+        index = url.find(separator, 0, end)
+        if index != -1:
+            end = index
+    scheme_end = url.find("://", 0, end)
+    path_start = url.find("/", scheme_end + 3 if scheme_end != -1 else 0, end)
+    if path_start == -1:
+        return ""
+    # 与 urlparse 一致：最后一段中 ';' 之后为 params，不属于路径。
+    segment = url[url.rfind("/", path_start, end) + 1 : end].partition(";")[0]
+    # 与 splitext 一致：忽略文件名开头的点（如 .hidden）。
+    name = segment.lstrip(".")
+    dot = name.find(".")
+    if dot == -1:
+        return ""
+    return name[dot:]
+
+
+@lru_cache(maxsize=64)
+def _guess_mime_from_suffix(suffix: str) -> str:
+    """按后缀推断 MIME；后缀取值有限，缓存命中率远高于按完整 URL 缓存。"""
+    guessedMime, _ = mimetypes.guess_type(f"/file{suffix}")
+    return guessedMime or ""
+
 
 def guess_mime_from_http_url(url: str, default_mime: str = "") -> str:
-    parsed = urlparse(url.strip())
-    guessedMime, _ = mimetypes.guess_type(parsed.path)
-    return guessedMime or default_mime
+    suffix = _extract_url_suffix(url.strip())
+    if not suffix:
+        return default_mime
+    return _guess_mime_from_suffix(suffix) or default_mime
 
 
 def extract_mime_from_data_url(data_url: str, default_mime: str = "") -> str:
     normalized_default_mime = normalize_mime(default_mime)
+    # MIME 位于首个逗号之前，只解析头部切片即可，避免拷贝整段 payload；
+    # 头部异常地长（切片内无逗号）时退回解析完整字符串。
+    head = data_url[:_DATA_URL_HEADER_SCAN_CHARS]
+    if "," not in head:
+        head = data_url
     try:
-        header = parse_data_url_header(data_url)
+        header = parse_data_url_header(head)
     except Exception:
         return normalized_default_mime
     return header.mime or normalized_default_mime
 
 
+def _sniff_image_signature(data: bytes) -> tuple[str, str] | None:
+    """按魔数表快速识别常见图片格式，未命中或无法确定时返回 None。"""
+    if not data:
+        return None
+    candidates = _IMAGE_SIGNATURES_BY_FIRST_BYTE.get(data[0], ())
+    for signature, mime, extension in candidates:
+        if not data.startswith(signature):
+            continue
+        if mime == "image/webp":
+            # RIFF 容器还需校验 WEBP 标记，否则交给 filetype 处理（如 WAV/AVI）。
+            if data[8:14] != b"WEBPVP":
+                return None
+        elif mime == "image/png":
+            # APNG 与 PNG 共用签名，签名窗口内含 acTL 块时交给 filetype 区分。
+            if data.find(b"acTL", 0, _FILETYPE_SIGNATURE_BYTES) != -1:
+                return None
+        elif mime == "image/tiff" and (len(data) <= 9 or data[8:10] == b"CR"):
+            # CR2 与 TIFF 共用签名，按 filetype 规则排除。
+            return None
+        return (mime, extension)
+    return None
+
+
+@lru_cache(maxsize=128)
+def _guess_file_type(head: bytes) -> tuple[str, str]:
+    """filetype 回退判定；结果只取决于签名窗口，可按窗口内容缓存。"""
+    guessedType = filetype.guess(head)
+    return (
+        getattr(guessedType, "mime", ""),
+        getattr(guessedType, "extension", ""),
+    )
+
+
 def sniff_file_type(
     data: bytes,
     default_mime: str = "application/octet-stream",
     default_extension: str = "bin",
 ) -> tuple[str, str]:
     normalized_default = normalize_mime(default_mime) or "application/octet-stream"
-    guessedType = filetype.guess(data)
-    mime = getattr(guessedType, "mime", "") or normalized_default
-    extension = getattr(guessedType, "extension", "") or default_extension
+    sniffed = _sniff_image_signature(data)
+    if sniffed is not None:
+        return sniffed
+    guessed_mime, guessed_extension = _guess_file_type(data[:_FILETYPE_SIGNATURE_BYTES])
+    mime = guessed_mime or normalized_default
+    extension = guessed_extension or default_extension
     return (mime, extension)
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+# 与 str.split() 判定一致的 ASCII 空白字符，用 str.translate 单次删除。
+_ASCII_WHITESPACE_DELETE_TABLE = str.maketrans("", "", " \t\n\v\f\r\x1c\x1d\x1e\x1f")
+
 
 def normalize_mime(value: str) -> str:
     return value.strip().lower()
 
 
 def normalize_base64_payload(value: str) -> str:
-    normalized = value.strip()
-    if normalized.startswith("base64://"):
-        normalized = normalized.removeprefix("base64://")
-    normalized = "".join(normalized.split())
+    normalized = value.strip().removeprefix("base64://")
+    if normalized.isascii():
+        normalized = normalized.translate(_ASCII_WHITESPACE_DELETE_TABLE)
+    else:
+        normalized = "".join(normalized.split())
     if not normalized:
         raise ValueError("base64 payload is empty.")
     return normalized
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from ..utils.http import get_bytes
 from .blob import ImageBlob, ResourceBlob
 from .codec import (
+    build_normalized_base64_data_url,
     decode_base64_payload,
-    transfer_base64_to_data_url,
     transfer_data_url_to_base64,
     transfer_data_url_to_bytes,
 )
@@ -30,6 +31,30 @@ def _ensure_max_bytes(data: bytes, max_bytes: int | None) -> None:
         raise ValueError(f"resource data exceeds max_bytes: {len(data)} > {max_bytes}.")
 
 
+def _normalize_http_url_raw(raw: str) -> str:
+    if not raw.startswith(("http://", "https://")):
+        raise ValueError("http_url resource must be a valid http(s) URL.")
+    return raw
+
+
+def _normalize_data_url_raw(raw: str) -> str:
+    if not raw.startswith("data:"):
+        raise ValueError("data_url resource must start with 'data:'.")
+    return raw
+
+
+# 按 kind 分派的 raw 校验/规范化与 MIME 推断，构造时各只需一次字典查找。
+_RAW_NORMALIZERS: dict[str, Callable[[str], str]] = {
+    "http_url": _normalize_http_url_raw,
+    "data_url": _normalize_data_url_raw,
+    "base64": normalize_base64_payload,
+}
+_MIME_GUESSERS: dict[str, Callable[[str, str], str]] = {
+    "http_url": guess_mime_from_http_url,
+    "data_url": extract_mime_from_data_url,
+}
+
+
 @dataclass(slots=True)
 class ResourceSpec:
     kind: ResourceKind
@@ -43,23 +68,16 @@ class ResourceSpec:
         if not normalized_raw:
             raise ValueError("raw resource value must not be empty.")
 
-        if self.kind == "http_url":
-            if not normalized_raw.startswith(("http://", "https://")):
-                raise ValueError("http_url resource must be a valid http(s) URL.")
-        elif self.kind == "data_url":
-            if not normalized_raw.startswith("data:"):
-                raise ValueError("data_url resource must start with 'data:'.")
-        elif self.kind == "base64":
-            normalized_raw = normalize_base64_payload(normalized_raw)
-        else:
+        normalize_raw = _RAW_NORMALIZERS.get(self.kind)
+        if normalize_raw is None:
             raise ValueError(f"unsupported resource kind: {self.kind}")
+        normalized_raw = normalize_raw(normalized_raw)
 
         normalized_mime = normalize_mime(self.mime)
         if not normalized_mime:
-            if self.kind == "http_url":
-                normalized_mime = guess_mime_from_http_url(normalized_raw, "")
-            elif self.kind == "data_url":
-                normalized_mime = extract_mime_from_data_url(normalized_raw, "")
+            guess_mime = _MIME_GUESSERS.get(self.kind)
+            if guess_mime is not None:
+                normalized_mime = guess_mime(normalized_raw, "")
 
         self.raw = normalized_raw
         self.mime = normalized_mime
@@ -94,7 +112,10 @@ class ResourceSpec:
         if self.kind == "data_url":
             return self.raw
         mime = self.mime or normalize_mime(default_mime)
-        return transfer_base64_to_data_url(mime, self.raw)
+        if not mime:
+            raise ValueError("mime is required to build data URL.")
+        # raw 已在 __post_init__ 中规范化，直接拼接，省去整段 payload 的再次处理。
+        return build_normalized_base64_data_url(mime, self.raw)
 
     async def convert_to_resource_blob(
         self,
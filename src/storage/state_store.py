@@ -72,6 +72,7 @@ class PluginStateStore:
         self._kv_get = kv_get
         self._kv_put = kv_put
         self._state: PluginState = {}
+        self._image_models: tuple[str, ...] = ()
         self._lock = asyncio.Lock()
         self._validators: dict[str, StateValueValidator] = {
             CURRENT_IMAGE_MODEL_KEY: self._validate_current_image_model,
@@ -84,6 +85,7 @@ class PluginStateStore:
                 self._config.get(CONFIG_IMAGE_MODELS_KEY)
             )
             self._config[CONFIG_IMAGE_MODELS_KEY] = list(image_models)
+            self._image_models = tuple(image_models)
 
             if not image_models:
                 logger.warning(
@@ -108,6 +110,10 @@ class PluginStateStore:
         """读取配置值。"""
         return self._config.get(key, default)
 
+    def get_image_models(self) -> tuple[str, ...]:
+        """读取 initialize 时规范化后的生图模型列表，无需调用方再做类型校验。"""
+        return self._image_models
+
     async def get_value(self, key: str, default: str = "") -> str:
         """读取缓存中的状态值。"""
         async with self._lock:
@@ -145,9 +151,7 @@ class PluginStateStore:
         await self._kv_put(PLUGIN_STATE_KEY, self._snapshot())
 
     def _validate_current_image_model(self, value: str) -> str:
-        image_models = self._config.get(CONFIG_IMAGE_MODELS_KEY)
-        assert isinstance(image_models, list)
-        if value and value not in image_models:
+        if value and value not in self._image_models:
             raise ValueError(f"Unsupported image model: {value}")
         return value
 
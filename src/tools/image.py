@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from astrbot.api.event import AstrMessageEvent
 from astrbot.api.message_components import Image
 
@@ -32,10 +34,26 @@ def _parse_image_component_raw(
     return None
 
 
+async def _convert_image_component_to_spec(component: Image) -> ResourceSpec | None:
+    """将无法直接解析的图片组件转换为 base64 形式的 `ResourceSpec`。"""
+    try:
+        encoded = await component.convert_to_base64()
+    except Exception:
+        logger.exception("Failed to convert input image to base64.")
+        return None
+    try:
+        return ResourceSpec.from_base64(encoded, mime="image/png")
+    except ValueError:
+        logger.exception("Failed to convert normalized base64 image to ResourceSpec.")
+        return None
+
+
 async def extract_images_from_event(event: AstrMessageEvent) -> list[ResourceSpec]:
     """从消息事件提取图片并统一为 `ResourceSpec`。"""
 
-    images: list[ResourceSpec] = []
+    images: list[ResourceSpec | None] = []
+    # 需要回退为 base64 的组件：(在 images 中的位置, 组件)，稍后并发转换。
+    pending: list[tuple[int, Image]] = []
     for component in event.get_messages():
         if not isinstance(component, Image):
             continue
@@ -55,18 +73,17 @@ async def extract_images_from_event(event: AstrMessageEvent) -> list[ResourceSpe
                     "reason": str(exc),
                 },
             )
-        try:
-            encoded = await component.convert_to_base64()
-        except Exception:
-            logger.exception("Failed to convert input image to base64.")
-            continue
-        try:
-            images.append(ResourceSpec.from_base64(encoded, mime="image/png"))
-        except ValueError:
-            logger.exception(
-                "Failed to convert normalized base64 image to ResourceSpec."
-            )
-    return images
+        pending.append((len(images), component))
+        images.append(None)
+
+    if pending:
+        # 各组件的 base64 转换互不依赖（读文件/下载），并发执行并按原顺序回填。
+        converted = await asyncio.gather(
+            *(_convert_image_component_to_spec(component) for _, component in pending)
+        )
+        for (index, _), spec in zip(pending, converted):
+            images[index] = spec
+    return [image for image in images if image is not None]
 
 
 def build_image_send_result(event: AstrMessageEvent, image: ResourceSpec):
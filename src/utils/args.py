@@ -1,27 +1,27 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def _normalize_command_tokens(command_tokens: tuple[str, ...]) -> tuple[str, ...]:
+    """归一化命令词（去空白、转小写、丢弃空项）；命令词通常为固定常量，结果可缓存。"""
+    return tuple(
+        normalized for token in command_tokens if (normalized := token.strip().lower())
+    )
 
 
 def extract_command_args(message_str: str, command_tokens: Sequence[str]) -> str:
     """提取命令后的原始参数文本。"""
     tokens = message_str.strip().split()
-    normalized_message = " ".join(tokens)
-
-    normalized_command = [
-        token.strip().lower() for token in command_tokens if token.strip()
-    ]
-    if not normalized_command:
-        return normalized_message
-
+    normalized_command = _normalize_command_tokens(tuple(command_tokens))
     if len(tokens) < len(normalized_command):
-        return normalized_message
+        return " ".join(tokens)
 
-    matched = all(
-        tokens[index].lower() == normalized_command[index]
-        for index in range(len(normalized_command))
-    )
-    if not matched:
-        return normalized_message
+    # 逐词比较，首个不匹配即返回，避免额外构造中间列表。
+    for token, command_token in zip(tokens, normalized_command):
+        if token.lower() != command_token:
+            return " ".join(tokens)
 
     return " ".join(tokens[len(normalized_command) :])
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
+from functools import lru_cache
 from typing import Any, TypedDict
 
 import aiohttp
+import orjson
 
 from .errors import PluginErrorCode, PluginException
 from .log import logger
@@ -29,15 +30,82 @@ class GetBytesSuccessResponse(TypedDict):
     elapsed_ms: int
 
 
+# 共享连接池参数：上游多为同一主机，放宽空闲连接保活时间以便跨命令复用。
+_CONNECTOR_LIMIT_PER_HOST = 16
+_CONNECTOR_KEEPALIVE_TIMEOUT_SEC = 30
+# DNS 解析结果缓存时间；安装 aiodns 时 aiohttp 会自动改用异步解析器。
+_CONNECTOR_DNS_CACHE_TTL_SEC = 300
+
+_shared_session: aiohttp.ClientSession | None = None
+_shared_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _get_shared_session() -> aiohttp.ClientSession:
+    """返回复用连接池的共享会话；首次调用、已关闭或事件循环变化时重建。"""
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_session is None
+        or _shared_session.closed
+        or _shared_session_loop is not loop
+    ):
+        previous_session = _shared_session
+        previous_loop = _shared_session_loop
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+                keepalive_timeout=_CONNECTOR_KEEPALIVE_TIMEOUT_SEC,
+                ttl_dns_cache=_CONNECTOR_DNS_CACHE_TTL_SEC,
+            ),
+            # 只复用连接、不保留 Cookie：上游与图片站点下发的 Cookie 不应跨请求回传。
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        _shared_session_loop = loop
+        if previous_session is not None and not previous_session.closed:
+            await _close_stale_session(previous_session, previous_loop)
+    return _shared_session
+
+
+async def _close_stale_session(
+    session: aiohttp.ClientSession,
+    loop: asyncio.AbstractEventLoop | None,
+) -> None:
+    """关闭绑定在旧事件循环上的会话，避免连接池泄漏。"""
+    if loop is None or loop.is_closed():
+        # 旧循环已关闭时连接器不再调度任何任务，可在当前循环直接完成关闭。
+        await session.close()
+        return
+    # 旧循环仍存活：关闭涉及其上的传输与 future，须交回该循环执行。
+    asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+
+async def close_shared_session() -> None:
+    """关闭共享会话，供插件停用/卸载时释放连接池。"""
+    global _shared_session, _shared_session_loop
+    session = _shared_session
+    _shared_session = None
+    _shared_session_loop = None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+@lru_cache(maxsize=8)
+def _client_timeout(total: int) -> aiohttp.ClientTimeout:
+    """按超时秒数复用 ClientTimeout；调用方通常只使用少数几个固定值。"""
+    return aiohttp.ClientTimeout(total=total)
+
+
+_SECRET_HEADER_KEYS = frozenset({"authorization", "cookie", "set-cookie", "x-api-key"})
+
+
 def _mask_headers(headers: dict[str, str]) -> dict[str, str]:
-    secret_keys = {"authorization", "cookie", "set-cookie", "x-api-key"}
-    masked: dict[str, str] = {}
-    for key, value in headers.items():
-        if key.lower() in secret_keys:
-            masked[key] = "<redacted>"
-            continue
-        masked[key] = value
-    return masked
+    # 多数请求/响应头不含敏感字段，此时直接返回原对象（仅用于日志与错误详情，不会被修改）。
+    if not any(key.lower() in _SECRET_HEADER_KEYS for key in headers):
+        return headers
+    return {
+        key: "<redacted>" if key.lower() in _SECRET_HEADER_KEYS else value
+        for key, value in headers.items()
+    }
 
 
 async def request(
@@ -88,53 +156,63 @@ async def request(
     }
     logger.debug("http.request", request_error_detail)
 
-    timeout = aiohttp.ClientTimeout(total=timeout_sec)
+    timeout = _client_timeout(timeout_sec)
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            request_kwargs: dict[str, Any] = {"headers": normalized_headers}
-            if payload is not None:
-                request_kwargs["json"] = payload
-
-            async with session.request(
-                normalized_method,
-                url,
-                **request_kwargs,
-            ) as response:
-                body = await response.read()
-                response_headers = dict(response.headers)
-
-                masked_response_headers = _mask_headers(response_headers)
-                elapsed_ms = int((time.perf_counter() - started_at) * 1000)
-                logger.debug(
-                    "http.response",
-                    {
+        # 复用共享会话的连接池，避免每次请求都重新建立 TCP/TLS 连接。
+        session = await _get_shared_session()
+        request_kwargs: dict[str, Any] = {
+            "headers": normalized_headers,
+            "timeout": timeout,
+        }
+        if payload is not None:
+            # orjson 直接产出 UTF-8 bytes，省去 json.dumps 的中间 str 及再次编码。
+            request_kwargs["data"] = orjson.dumps(payload)
+            if not any(key.lower() == "content-type" for key in normalized_headers):
+                request_kwargs["headers"] = {
+                    **normalized_headers,
+                    "Content-Type": "application/json",
+                }
+
+        async with session.request(
+            normalized_method,
+            url,
+            **request_kwargs,
+        ) as response:
+            body = await response.read()
+            response_headers = dict(response.headers)
+
+            masked_response_headers = _mask_headers(response_headers)
+            elapsed_ms = int((time.perf_counter() - started_at) * 1000)
+            logger.debug(
+                "http.response",
+                {
+                    "elapsed_ms": elapsed_ms,
+                    "status_code": response.status,
+                    "headers": masked_response_headers,
+                },
+            )
+
+            # HTTP 错误由状态码判断，保留响应片段用于问题定位
+            if response.status >= 400:
+                raise PluginException(
+                    code=PluginErrorCode.UPSTREAM_ERROR,
+                    message=f"{source} HTTP {response.status}",
+                    retryable=(response.status >= 500 or response.status == 429),
+                    detail={
+                        **request_error_detail,
                         "elapsed_ms": elapsed_ms,
                         "status_code": response.status,
                         "headers": masked_response_headers,
+                        "body": body.decode("utf-8", errors="replace"),
                     },
                 )
 
-                # HTTP 错误由状态码判断，保留响应片段用于问题定位
-                if response.status >= 400:
-                    raise PluginException(
-                        code=PluginErrorCode.UPSTREAM_ERROR,
-                        message=f"{source} HTTP {response.status}",
-                        retryable=(response.status >= 500 or response.status == 429),
-                        detail={
-                            **request_error_detail,
-                            "elapsed_ms": elapsed_ms,
-                            "status_code": response.status,
-                            "headers": masked_response_headers,
-                            "body": body.decode("utf-8", errors="replace"),
-                        },
-                    )
-
-                return {
-                    "status_code": response.status,
-                    "headers": response_headers,
-                    "body": body,
-                    "elapsed_ms": elapsed_ms,
-                }
+            return {
+                "status_code": response.status,
+                "headers": response_headers,
+                "body": body,
+                "elapsed_ms": elapsed_ms,
+            }
 
     except asyncio.TimeoutError as exc:
         elapsed_ms = int((time.perf_counter() - started_at) * 1000)
@@ -185,10 +263,11 @@ async def post_json(
         "payload": payload,
     }
 
-    raw_text = response["body"].decode("utf-8", errors="replace")
+    # orjson 直接解析 bytes，省去整段响应（可能内联大体积 data URL）先解码为 str 的拷贝。
     try:
-        data = json.loads(raw_text)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(response["body"])
+    except orjson.JSONDecodeError as exc:
+        raw_text = response["body"].decode("utf-8", errors="replace")
         raise PluginException(
             code=PluginErrorCode.UPSTREAM_ERROR,
             message=f"{source} returned invalid JSON.",
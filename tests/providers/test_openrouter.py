@@ -110,6 +110,24 @@ async def test_openrouter_request_uses_default_base_url_when_empty(
     assert captured["url"] == f"{OPENROUTER_DEFAULT_BASE_URL}/chat/completions"
 
 
+@pytest.mark.asyncio
+async def test_openrouter_request_without_api_key_raises_permission_denied() -> None:
+    """验证：未配置 api_key 时仍可构造适配器，但请求会抛出权限错误。"""
+    adapter = OpenRouterAdapter(
+        base_url="",
+        api_key="   ",
+        timeout_sec=30,
+        image_model="test-image-model",
+        tool_model="test-tool-model",
+        save_image_format="png",
+    )
+
+    with pytest.raises(PluginException) as exc_info:
+        await adapter._request_chat_completions({"messages": []})
+
+    assert exc_info.value.code == PluginErrorCode.PERMISSION_DENIED
+
+
 @pytest.mark.asyncio
 async def test_openrouter_image_generate_success(
     monkeypatch: pytest.MonkeyPatch,
@@ -350,6 +368,36 @@ async def test_openrouter_image_generate_jpg_postprocess(
     assert result.warnings == []
 
 
+@pytest.mark.asyncio
+async def test_openrouter_process_output_images_keeps_order_and_falls_back() -> None:
+    """验证：并发转 jpg 时结果保持原顺序，失败项回退原图并按序号告警。"""
+    adapter = OpenRouterAdapter(
+        base_url="https://openrouter.ai/api/v1",
+        api_key="test-key",
+        timeout_sec=30,
+        image_model="test-image-model",
+        tool_model="test-tool-model",
+        save_image_format="jpg",
+    )
+    broken = ResourceSpec.from_data_url("data:text/plain,hello")
+    images = [
+        ResourceSpec.from_data_url(
+            "data:image/png;base64,"
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+nmf8AAAAASUVORK5CYII="
+        ),
+        broken,
+    ]
+    warnings: list[str] = []
+
+    result = await adapter._process_output_images(images, warnings)
+
+    assert result[0].kind == "base64"
+    assert result[0].mime == "image/jpeg"
+    assert result[1] is broken
+    assert len(warnings) == 1
+    assert warnings[0].startswith("image[1] convert to jpg failed")
+
+
 @pytest.mark.asyncio
 async def test_image_generate_tool_returns_single_detail_text_without_sendable_images(
     monkeypatch: pytest.MonkeyPatch,
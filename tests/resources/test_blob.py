@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from io import BytesIO
+from io import BytesIO, UnsupportedOperation
 
 import pytest
 from PIL import Image
@@ -23,6 +23,17 @@ def test_resource_blob_sniff_and_encode() -> None:
     assert blob.to_data_url().startswith("data:image/png;base64,")
 
 
+def test_resource_blob_caches_base64() -> None:
+    """验证：to_base64 结果按实例缓存，data URL 在缓存前后保持一致。"""
+    blob = ResourceBlob(data=_build_png_bytes())
+    data_url = blob.to_data_url()
+
+    encoded = blob.to_base64()
+
+    assert blob.to_base64() is encoded
+    assert blob.to_data_url() == data_url == f"data:image/png;base64,{encoded}"
+
+
 def test_resource_blob_save(tmp_path) -> None:
     """验证：save 会写入目标文件并返回目标路径。"""
     blob = ResourceBlob(data=b"abc", default_mime="application/octet-stream")
@@ -60,3 +71,79 @@ def test_image_blob_compress_to_jpg_quality_validation() -> None:
 
     with pytest.raises(ValueError, match="quality must be in \\[1, 95\\]"):
         source.compress_to_jpg(quality=0)
+
+
+def test_image_blob_compress_to_jpg_stream_writes_to_sink(tmp_path) -> None:
+    """验证：compress_to_jpg_stream 直接写入 sink，内容与 compress_to_jpg 一致。"""
+    source = ImageBlob(data=_build_png_bytes(), default_mime="image/png")
+    output_path = tmp_path / "a.jpg"
+
+    with output_path.open("wb") as sink:
+        written = source.compress_to_jpg_stream(sink, quality=80)
+
+    assert written == output_path.stat().st_size
+    assert output_path.read_bytes() == source.compress_to_jpg(quality=80).data
+
+
+class _NonSeekableSink(BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        raise UnsupportedOperation("tell")
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        raise UnsupportedOperation("seek")
+
+
+def test_image_blob_compress_to_jpg_stream_supports_non_seekable_sink() -> None:
+    """验证：sink 不支持 tell/seek（如管道）时仍可写入并返回正确字节数。"""
+    source = ImageBlob(data=_build_png_bytes(), default_mime="image/png")
+    sink = _NonSeekableSink()
+
+    written = source.compress_to_jpg_stream(sink, quality=80)
+
+    expected = source.compress_to_jpg(quality=80).data
+    assert written == len(expected)
+    assert sink.getvalue() == expected
+
+
+def test_image_blob_compress_to_jpg_opaque_rgba_keeps_colors() -> None:
+    """验证：完全不透明的 RGBA 图片压缩后颜色保持不变。"""
+    image = Image.new("RGBA", (4, 4), (0, 0, 255, 255))
+    output = BytesIO()
+    image.save(output, format="PNG")
+    source = ImageBlob(data=output.getvalue(), default_mime="image/png")
+
+    compressed = source.compress_to_jpg(quality=95)
+
+    with Image.open(BytesIO(compressed.data)) as result:
+        red, green, blue = result.convert("RGB").getpixel((1, 1))
+    assert red < 16 and green < 16 and blue > 239
+
+
+@pytest.mark.parametrize("image_format", ["JPEG", "PNG"])
+def test_image_blob_compress_to_jpg_max_side_downscales(image_format: str) -> None:
+    """验证：指定 max_side 时按比例缩小到长边不超过该值。"""
+    image = Image.new("RGB", (400, 200), (0, 128, 0))
+    output = BytesIO()
+    image.save(output, format=image_format)
+    source = ImageBlob(data=output.getvalue())
+
+    compressed = source.compress_to_jpg(max_side=100)
+
+    with Image.open(BytesIO(compressed.data)) as result:
+        assert result.size == (100, 50)
+    with pytest.raises(ValueError, match="max_side must be > 0"):
+        source.compress_to_jpg(max_side=0)
+
+
+@pytest.mark.asyncio
+async def test_image_blob_compress_to_jpg_async_matches_sync() -> None:
+    """验证：compress_to_jpg_async 与同步版本输出一致。"""
+    source = ImageBlob(data=_build_png_bytes(), default_mime="image/png")
+
+    compressed = await source.compress_to_jpg_async(quality=80)
+
+    assert compressed.mime == "image/jpeg"
+    assert compressed.data == source.compress_to_jpg(quality=80).data
@@ -3,7 +3,10 @@ from __future__ import annotations
 import pytest
 from src.resources.codec import (
     decode_base64_payload,
+    encode_base64_payload,
     parse_data_url_header,
+    transfer_base64_to_data_url,
+    transfer_bytes_to_data_url,
     transfer_data_url_to_base64,
     transfer_data_url_to_bytes,
 )
@@ -33,3 +36,27 @@ def test_decode_base64_payload_raises_for_invalid_input() -> None:
     """验证：非法 base64 输入会抛出 ValueError。"""
     with pytest.raises(ValueError, match="base64 payload is invalid"):
         decode_base64_payload("%%%")
+
+
+def test_decode_base64_payload_raises_for_unpadded_input() -> None:
+    """验证：长度不是 4 的倍数的 base64 输入会直接判定为非法。"""
+    with pytest.raises(ValueError, match="base64 payload is invalid"):
+        decode_base64_payload("Zm9vY")
+
+
+@pytest.mark.parametrize("payload", ["Zz90=", "AAAA="])
+def test_decode_base64_payload_rejects_over_padded_input(payload: str) -> None:
+    """验证：多余的 = 填充被判定为非法（标准库 b64decode 会忽略并接受）。"""
+    with pytest.raises(ValueError, match="base64 payload is invalid"):
+        decode_base64_payload(payload)
+
+
+def test_transfer_bytes_to_data_url_matches_base64_path() -> None:
+    """验证：直接由 bytes 组装的 data URL 与先编码再组装的结果一致。"""
+    data = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+
+    assert transfer_bytes_to_data_url(" Image/PNG ", data) == (
+        transfer_base64_to_data_url("image/png", encode_base64_payload(data))
+    )
+    with pytest.raises(ValueError, match="mime is required"):
+        transfer_bytes_to_data_url("", data)
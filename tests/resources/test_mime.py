@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import mimetypes
+from io import BytesIO
+from urllib.parse import urlparse
+
+import filetype
+import pytest
+from PIL import Image
+from src.resources.mime import (
+    extract_mime_from_data_url,
+    guess_mime_from_http_url,
+    sniff_file_type,
+)
+
+
+def _build_image_bytes(image_format: str, mode: str = "RGB") -> bytes:
+    image = Image.new(mode, (4, 4), (255, 0, 0))
+    output = BytesIO()
+    image.save(output, format=image_format)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("image_format", ["PNG", "JPEG", "GIF", "WEBP", "BMP", "TIFF"])
+def test_sniff_file_type_matches_filetype_for_common_images(image_format: str) -> None:
+    """验证：常见图片走魔数表快速识别，结果与 filetype 保持一致。"""
+    data = _build_image_bytes(image_format)
+    expected = filetype.guess(data)
+
+    assert sniff_file_type(data) == (expected.mime, expected.extension)
+
+
+def test_sniff_file_type_falls_back_to_default_for_unknown_data() -> None:
+    """验证：无法识别的数据回退到默认 MIME 与扩展名。"""
+    mime, extension = sniff_file_type(b"hello", "Text/Plain", "txt")
+
+    assert mime == "text/plain"
+    assert extension == "txt"
+
+
+def test_sniff_file_type_keeps_apng_detection() -> None:
+    """验证：APNG 与 PNG 共用签名时仍由 filetype 识别为 APNG。"""
+    frames = [Image.new("RGB", (4, 4), color) for color in ((255, 0, 0), (0, 255, 0))]
+    output = BytesIO()
+    frames[0].save(output, format="PNG", save_all=True, append_images=frames[1:])
+
+    assert sniff_file_type(output.getvalue()) == ("image/apng", "apng")
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com",
+        "https://example.com/a/B.PNG?sig=x.jpg#frag.gif",
+        "https://example.com/a.b/c",
+        "https://example.com/.png",
+        "https://example.com/a.tar.gz",
+        "https://example.com/a.png;v=1",
+        "https://example.com?name=a.png",
+        "https://example.com/p.:.a",
+    ],
+)
+def test_guess_mime_from_http_url_matches_urlparse(url: str) -> None:
+    """验证：后缀扫描结果与 urlparse + mimetypes 的判定保持一致。"""
+    expected, _ = mimetypes.guess_type(urlparse(url).path)
+
+    assert guess_mime_from_http_url(url, "default") == (expected or "default")
+
+
+def test_extract_mime_from_data_url_reads_header_only_and_falls_back() -> None:
+    """验证：data URL 只按头部提取 MIME，头部超长或缺少 MIME 时结果不变。"""
+    long_header = "data:image/webp;" + "x=1;" * 100 + "base64,AAAA"
+
+    assert extract_mime_from_data_url("data:image/png;base64," + "A" * 4096) == (
+        "image/png"
+    )
+    assert extract_mime_from_data_url(long_header) == "image/webp"
+    assert extract_mime_from_data_url("data:;base64,AAAA", "Image/Gif") == "image/gif"
@@ -146,3 +146,14 @@ async def test_get_config_value_reads_existing_and_default_values() -> None:
 
     assert image_models == ["model-a", "model-b"]
     assert not_exists == "fallback"
+
+
+@pytest.mark.asyncio
+async def test_get_image_models_returns_normalized_models() -> None:
+    """验证：get_image_models 返回 initialize 时规范化后的模型列表。"""
+    config: dict[str, object] = {CONFIG_IMAGE_MODELS_KEY: [" model-a ", "", "model-b"]}
+    kv = _FakeKV()
+    store = PluginStateStore(config=config, kv_get=kv.get, kv_put=kv.put)
+    await store.initialize()
+
+    assert store.get_image_models() == ("model-a", "model-b")
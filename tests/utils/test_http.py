@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.utils.errors import PluginException
+from src.utils.http import (
+    _get_shared_session,
+    _mask_headers,
+    close_shared_session,
+    get_bytes,
+    post_json,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_bytes_reuses_pooled_connection() -> None:
+    """验证：连续请求同一主机时复用共享会话中的连接。"""
+    client_peers: list[object] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        client_peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(body=b"ok", content_type="text/plain")
+
+    app = web.Application()
+    app.router.add_get("/ping", handler)
+    async with TestServer(app) as server:
+        url = str(server.make_url("/ping"))
+        try:
+            first = await get_bytes(url=url)
+            second = await get_bytes(url=url)
+        finally:
+            await close_shared_session()
+
+    assert first["data"] == b"ok"
+    assert second["mime"] == "text/plain"
+    assert len(client_peers) == 2
+    assert client_peers[0] == client_peers[1]
+
+
+@pytest.mark.asyncio
+async def test_shared_session_does_not_persist_cookies() -> None:
+    """验证：共享会话不保存上游下发的 Cookie，后续请求不会回传。"""
+    received_cookies: list[str | None] = []
+
+    async def set_cookie(request: web.Request) -> web.Response:
+        response = web.Response(body=b"set", content_type="text/plain")
+        response.set_cookie("session", "secret")
+        return response
+
+    async def echo(request: web.Request) -> web.Response:
+        received_cookies.append(request.headers.get("Cookie"))
+        return web.Response(body=b"echo", content_type="text/plain")
+
+    app = web.Application()
+    app.router.add_get("/set", set_cookie)
+    app.router.add_get("/echo", echo)
+    async with TestServer(app, host="localhost") as server:
+        try:
+            await get_bytes(url=str(server.make_url("/set")))
+            await get_bytes(url=str(server.make_url("/echo")))
+        finally:
+            await close_shared_session()
+
+    assert received_cookies == [None]
+
+
+def test_shared_session_closes_previous_loop_session() -> None:
+    """验证：事件循环变化时重建共享会话，并关闭旧循环上的会话。"""
+
+    async def acquire() -> aiohttp.ClientSession:
+        return await _get_shared_session()
+
+    first = asyncio.run(acquire())
+
+    async def reacquire() -> aiohttp.ClientSession:
+        try:
+            return await _get_shared_session()
+        finally:
+            await close_shared_session()
+
+    second = asyncio.run(reacquire())
+
+    assert second is not first
+    assert first.closed
+
+
+@pytest.mark.asyncio
+async def test_post_json_parses_object_and_reports_invalid_json() -> None:
+    """验证：post_json 以 JSON 发送请求体并解析响应；响应非法时抛出异常并附带原始文本。"""
+
+    content_types: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        content_types.append(request.content_type)
+        body = await request.json()
+        if body.get("broken"):
+            return web.Response(body=b"not json", content_type="application/json")
+        return web.json_response({"echo": body["text"]})
+
+    app = web.Application()
+    app.router.add_post("/chat", handler)
+    async with TestServer(app) as server:
+        url = str(server.make_url("/chat"))
+        try:
+            ok = await post_json(url=url, payload={"text": "你好"}, headers={})
+            with pytest.raises(PluginException, match="invalid JSON") as exc_info:
+                await post_json(url=url, payload={"broken": True}, headers={})
+        finally:
+            await close_shared_session()
+
+    assert ok["data"] == {"echo": "你好"}
+    assert exc_info.value.detail["body"] == "not json"
+    assert content_types == ["application/json", "application/json"]
+
+
+def test_mask_headers_redacts_secrets_and_reuses_clean_headers() -> None:
+    """验证：敏感请求头（大小写不敏感）被替换为占位符；无敏感字段时原样返回。"""
+
+    clean = {"Content-Type": "application/json", "Accept": "*/*"}
+    assert _mask_headers(clean) is clean
+
+    secret = {"Authorization": "Bearer sk-test", "X-API-Key": "k", "Accept": "*/*"}
+    masked = _mask_headers(secret)
+    assert masked == {
+        "Authorization": "<redacted>",
+        "X-API-Key": "<redacted>",
+        "Accept": "*/*",
+    }
+    assert secret["Authorization"] == "Bearer sk-test"